@@ -38,6 +38,7 @@ class ClockPreset:
     background: str = "#000000"
     font: Optional[str] = None
     size: int = 20
+    # Deprecated: clock_display redraws on minute rollover and colon toggles, not on a fixed interval.
     interval: float = 0.5
     dot_flashing: bool = True
     dot_flash_period: float = 1.0
@@ -81,6 +82,8 @@ class DeviceConfig:
     auto_reconnect: bool = True
     reconnect_delay: float = 2.0
     mtu: int = 512
+    write_without_response: bool = False
+    rgb565: bool = False
     rotate: int = 0
     brightness: float = 0.85
     timezone: str = "auto"
@@ -144,6 +147,8 @@ DEFAULTS: Dict[str, Any] = {
         "auto_reconnect": True,
         "reconnect_delay": 2.0,
         "mtu": 512,
+        "write_without_response": False,
+        "rgb565": False,
         "rotate": 0,
         "brightness": 0.85,
         "timezone": "auto",
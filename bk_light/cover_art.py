@@ -0,0 +1,66 @@
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+# --quality choices for image resizing. Bilinear is indistinguishable from Lanczos at panel
+# resolution and much cheaper, so it is the default.
+RESAMPLE_BY_QUALITY: dict[str, Image.Resampling] = {
+    "fast": Image.Resampling.BILINEAR,
+    "high": Image.Resampling.LANCZOS,
+}
+
+
+def fit_to_canvas(
+    image: Image.Image,
+    canvas: tuple[int, int],
+    mode: str,
+    rotate: int,
+    mirror: bool,
+    invert: bool,
+    resample: Image.Resampling,
+) -> Image.Image:
+    """Resize an RGB image to the canvas per image preset mode, then rotate/mirror/invert it."""
+    rotate %= 360
+    # Right-angle turns commute with a centred square crop, so they can run on the canvas-sized image.
+    rotate_late = rotate % 90 == 0 and mode in ("fit", "cover") and canvas[0] == canvas[1]
+    if rotate and not rotate_late:
+        image = image.rotate(rotate, expand=False)
+    if mode in ("fit", "cover"):
+        image = ImageOps.fit(image, canvas, method=resample)
+    else:
+        image = image.resize(canvas, resample)
+    if rotate and rotate_late:
+        image = image.rotate(rotate, expand=False)
+    # Mirror/invert commute with the resize, so run them on the canvas-sized image.
+    if mirror:
+        image = ImageOps.mirror(image)
+    if invert:
+        image = ImageOps.invert(image)
+    return image
+
+
+def prepare_cover_image(
+    img_bytes: bytes,
+    canvas: tuple[int, int],
+    mode: str,
+    rotate: int,
+    mirror: bool,
+    invert: bool,
+    resample: Image.Resampling,
+) -> Image.Image:
+    """
+    Decode media cover art and fit it to the panel canvas.
+    CPU-bound; callers on an event loop should run it through `asyncio.to_thread`.
+    """
+    image = Image.open(BytesIO(img_bytes))
+    if image.format == "JPEG":
+        # Let libjpeg downscale during decode; only canvas-sized pixels are needed.
+        image.draft("RGB", canvas)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    # Cheap integer box downscale first, keeping 2x the canvas (Pillow's recommended reducing gap)
+    # so the final filter still has real pixels to work with.
+    factor = min(image.width // (canvas[0] * 2), image.height // (canvas[1] * 2))
+    if factor >= 2:
+        image = image.reduce(factor)
+    return fit_to_canvas(image, canvas, mode, rotate, mirror, invert, resample)
@@ -1,11 +1,13 @@
 import asyncio
 import binascii
+import functools
+import hashlib
 import os
 from io import BytesIO
 from typing import Optional
 from bleak import BleakClient, BleakScanner
 from bleak.exc import BleakError
-from PIL import Image, ImageEnhance
+from PIL import Image
 
 DEFAULT_ADDRESS = os.getenv("BK_LIGHT_ADDRESS")
 UUID_WRITE = "0000fa02-0000-1000-8000-00805f9b34fb"
@@ -39,18 +41,31 @@ def build_frame(png_bytes: bytes) -> bytes:
     return bytes(frame)
 
 
-def adjust_image(png_bytes: bytes, rotation: int, brightness: float) -> bytes:
-    image = Image.open(BytesIO(png_bytes)).convert("RGB")
+@functools.lru_cache(maxsize=8)
+def _channel_lut(brightness: float, rgb565: bool) -> list[int]:
+    # Same truncating scale as ImageEnhance.Brightness, optionally dropped to 5/6/5 bits per channel.
+    scaled = [min(255, int(value * brightness)) for value in range(256)]
+    if not rgb565:
+        return scaled * 3
+    return [v & 0xF8 for v in scaled] + [v & 0xFC for v in scaled] + [v & 0xF8 for v in scaled]
+
+
+def adjust_image_to_png(image: Image.Image, rotation: int, brightness: float, rgb565: bool = False) -> bytes:
+    if image.mode != "RGB":
+        image = image.convert("RGB")
     if rotation:
         image = image.rotate(rotation % 360, expand=False)
-    if brightness != 1.0:
-        enhancer = ImageEnhance.Brightness(image)
-        image = enhancer.enhance(brightness)
+    if brightness != 1.0 or rgb565:
+        image = image.point(_channel_lut(brightness, rgb565))
     buffer = BytesIO()
     image.save(buffer, format="PNG", optimize=False)
     return buffer.getvalue()
 
 
+def adjust_image(png_bytes: bytes, rotation: int, brightness: float, rgb565: bool = False) -> bytes:
+    return adjust_image_to_png(Image.open(BytesIO(png_bytes)), rotation, brightness, rgb565)
+
+
 class AckWatcher:
     def __init__(self, verbose: bool) -> None:
         self.stage_one = asyncio.Event()
@@ -95,6 +110,8 @@ class BleDisplaySession:
         rotation: int = 0,
         brightness: float = 1.0,
         mtu: int = 512,
+        write_without_response: bool = False,
+        rgb565: bool = False,
         log_notifications: bool = False,
         max_retries: int = 3,
         scan_timeout: float = 6.0,
@@ -108,13 +125,18 @@ class BleDisplaySession:
         self.rotation = rotation
         self.brightness = brightness
         self.mtu = mtu
+        self.write_without_response = write_without_response
+        self.rgb565 = rgb565
         self.log_notifications = log_notifications
         self.max_retries = max_retries
         self.scan_timeout = scan_timeout
         self.client: Optional[BleakClient] = None
         self.watcher = AckWatcher(log_notifications)
+        self.last_payload_digest: Optional[bytes] = None
 
     async def _safe_disconnect(self) -> None:
+        # A reconnected panel may have restarted; never assume it still shows the last frame.
+        self.last_payload_digest = None
         if self.client is None:
             return
         try:
@@ -187,13 +209,32 @@ class BleDisplaySession:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         await self._safe_disconnect()
 
-    async def send_png(self, png_bytes: bytes, delay: float = 0.2) -> None:
-        processed = adjust_image(png_bytes, self.rotation, self.brightness)
+    async def send_png(self, png_bytes: bytes, delay: float = 0.2, force: bool = False) -> None:
+        await self.send_image(Image.open(BytesIO(png_bytes)), delay, force)
+
+    async def send_image(self, image: Image.Image, delay: float = 0.2, force: bool = False) -> None:
+        processed = adjust_image_to_png(image, self.rotation, self.brightness, self.rgb565)
+        digest = hashlib.blake2b(processed, digest_size=8).digest()
+        if not force and digest == self.last_payload_digest and self.client and self.client.is_connected:
+            return
 
         if self.log_notifications:
             print(f"Processed PNG bytes: {len(processed)}")
         frame = build_frame(processed)
         await self.send_frame(frame, delay)
+        self.last_payload_digest = digest
+
+    async def _write_frame(self, frame: bytes) -> None:
+        characteristic = None
+        if self.write_without_response:
+            characteristic = self.client.services.get_characteristic(UUID_WRITE)
+        if characteristic is None or "write-without-response" not in characteristic.properties:
+            await self.client.write_gatt_char(UUID_WRITE, frame, response=True)
+            return
+        # Unacknowledged writes are not split by the BLE stack, so send one ATT packet at a time.
+        chunk_size = characteristic.max_write_without_response_size
+        for offset in range(0, len(frame), chunk_size):
+            await self.client.write_gatt_char(characteristic, frame[offset : offset + chunk_size], response=False)
 
     async def send_frame(self, frame: bytes, delay: float = 0.2) -> None:
         self.log_notifications = True
@@ -212,7 +253,7 @@ class BleDisplaySession:
                 await asyncio.sleep(delay)
                 if self.log_notifications:
                     print(f"Writing to {UUID_WRITE} frame ({len(frame)} bytes)")
-                await self.client.write_gatt_char(UUID_WRITE, frame, response=True)
+                await self._write_frame(frame)
                 await wait_for_ack(self.watcher.stage_three, "FRAME_ACK", self.log_notifications)
                 await asyncio.sleep(delay)
                 await self.client.write_gatt_char(UUID_WRITE, FRAME_VALIDATION, response=False)
@@ -1,12 +1,32 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import ssl
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Optional
-from urllib.parse import quote, urljoin
-from urllib.request import Request, urlopen
+from functools import lru_cache
+from http.client import HTTPConnection, HTTPResponse, HTTPSConnection, RemoteDisconnected
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+from urllib.error import HTTPError
+from urllib.parse import quote, urljoin, urlsplit
+from urllib.request import HTTPSHandler, OpenerDirector, Request, build_opener
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    import json
+
+    _loads = json.loads
+    _dumps = json.dumps
+
+
+# HA rejects binary WebSocket frames, so outbound messages stay `str`.
+_PING_TEMPLATE = '{"id":%d,"type":"ping"}'
 
 
 def normalize_base_url(base_url: str) -> str:
@@ -29,28 +49,140 @@ def to_ws_url(base_url: str) -> str:
     return "ws://" + base_url[len("http://") :] + "/api/websocket"
 
 
-def http_get_bytes(url: str, token: str, *, insecure_ssl: bool = False, timeout_s: float = 20.0) -> bytes:
+@lru_cache(maxsize=2)
+def _ssl_context(insecure_ssl: bool) -> ssl.SSLContext:
+    return ssl._create_unverified_context() if insecure_ssl else ssl.create_default_context()
+
+
+@lru_cache(maxsize=2)
+def _opener(insecure_ssl: bool) -> OpenerDirector:
+    return build_opener(HTTPSHandler(context=_ssl_context(insecure_ssl)))
+
+
+def open_ha_connection(base_url: str, insecure_ssl: bool = False, timeout_s: float = 20.0) -> HTTPConnection:
+    """
+    Keep-alive connection to HA that can be passed as `conn=` to the REST helpers.
+    Held for a whole watch loop, repeated fetches skip the TCP/TLS handshake; the socket is
+    opened lazily and reopened if HA drops it while idle. Not safe for concurrent use.
+    """
+    parts = urlsplit(normalize_base_url(base_url))
+    if parts.scheme == "https":
+        return HTTPSConnection(parts.hostname, parts.port, timeout=timeout_s, context=_ssl_context(insecure_ssl))
+    return HTTPConnection(parts.hostname, parts.port, timeout=timeout_s)
+
+
+@contextmanager
+def _ha_conn(base_url: str, insecure_ssl: bool = False, timeout_s: float = 20.0) -> Iterator[HTTPConnection]:
+    conn = open_ha_connection(base_url, insecure_ssl, timeout_s)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _conn_matches(conn: HTTPConnection, url: str) -> bool:
+    parts = urlsplit(url)
+    scheme = "https" if isinstance(conn, HTTPSConnection) else "http"
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return parts.scheme == scheme and parts.hostname == conn.host and port == conn.port
+
+
+def _conn_request(conn: HTTPConnection, path: str, headers: dict[str, str]) -> HTTPResponse:
+    try:
+        conn.request("GET", path, headers=headers)
+        return conn.getresponse()
+    except (RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        # HA closed the idle keep-alive socket; http.client reopens it on the retry below.
+        conn.close()
+    except Exception:
+        conn.close()
+        raise
+    try:
+        conn.request("GET", path, headers=headers)
+        return conn.getresponse()
+    except Exception:
+        conn.close()
+        raise
+
+
+def _http_get(
+    url: str,
+    token: str,
+    *,
+    insecure_ssl: bool = False,
+    timeout_s: float = 20.0,
+    conn: Optional[HTTPConnection] = None,
+    extra_headers: Optional[dict[str, str]] = None,
+) -> tuple[int, bytes, Any]:
     headers = {
         "Authorization": f"Bearer {token}",
         "User-Agent": "bk-light/ha-client",
+        **(extra_headers or {}),
     }
+    if conn is not None and _conn_matches(conn, url):
+        parts = urlsplit(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        resp = _conn_request(conn, path, headers)
+        body = resp.read()
+        if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+            return _http_get(
+                urljoin(url, resp.getheader("Location")),
+                token,
+                insecure_ssl=insecure_ssl,
+                timeout_s=timeout_s,
+                extra_headers=extra_headers,
+            )
+        if resp.status >= 400:
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return resp.status, body, resp.headers
     req = Request(url, headers=headers, method="GET")
-    context = ssl._create_unverified_context() if insecure_ssl else None
-    with urlopen(req, context=context, timeout=timeout_s) as resp:
-        return resp.read()
+    try:
+        with _opener(insecure_ssl).open(req, timeout=timeout_s) as resp:
+            return resp.status, resp.read(), resp.headers
+    except HTTPError as e:
+        if e.code == 304:
+            return 304, b"", e.headers
+        raise
+
+
+def http_get_bytes(
+    url: str,
+    token: str,
+    *,
+    insecure_ssl: bool = False,
+    timeout_s: float = 20.0,
+    conn: Optional[HTTPConnection] = None,
+) -> bytes:
+    return _http_get(url, token, insecure_ssl=insecure_ssl, timeout_s=timeout_s, conn=conn)[1]
 
 
-def ha_get_state(base_url: str, token: str, entity_id: str, *, insecure_ssl: bool = False) -> dict[str, Any]:
+def ha_get_state(
+    base_url: str,
+    token: str,
+    entity_id: str,
+    *,
+    insecure_ssl: bool = False,
+    conn: Optional[HTTPConnection] = None,
+) -> dict[str, Any]:
     base_url = normalize_base_url(base_url)
     url = to_absolute_url(base_url, f"/api/states/{quote(entity_id)}")
-    raw = http_get_bytes(url, token, insecure_ssl=insecure_ssl)
-    return json.loads(raw.decode("utf-8"))
+    raw = http_get_bytes(url, token, insecure_ssl=insecure_ssl, conn=conn)
+    return _loads(raw)
+
+
+def entity_picture_of(state_obj: Optional[dict]) -> Optional[str]:
+    return ((state_obj or {}).get("attributes") or {}).get("entity_picture")
 
 
 def ha_get_entity_picture_url(
-    base_url: str, token: str, entity_id: str, *, insecure_ssl: bool = False
+    base_url: str,
+    token: str,
+    entity_id: str,
+    *,
+    insecure_ssl: bool = False,
+    conn: Optional[HTTPConnection] = None,
 ) -> str:
-    st = ha_get_state(base_url, token, entity_id, insecure_ssl=insecure_ssl)
+    st = ha_get_state(base_url, token, entity_id, insecure_ssl=insecure_ssl, conn=conn)
     attr = (st or {}).get("attributes") or {}
     rel = attr.get("entity_picture") or attr.get("entity_picture_local")
     if not rel:
@@ -59,10 +191,43 @@ def ha_get_entity_picture_url(
 
 
 def ha_fetch_entity_picture_bytes(
-    base_url: str, token: str, entity_id: str, *, insecure_ssl: bool = False
-) -> bytes:
-    url = ha_get_entity_picture_url(base_url, token, entity_id, insecure_ssl=insecure_ssl)
-    return http_get_bytes(url, token, insecure_ssl=insecure_ssl)
+    base_url: str,
+    token: str,
+    entity_id: str,
+    *,
+    insecure_ssl: bool = False,
+    validators: Optional[dict[str, Optional[str]]] = None,
+    conn: Optional[HTTPConnection] = None,
+) -> Optional[bytes]:
+    """
+    Fetch the entity picture.
+    When `validators` is given, it is used to send a conditional GET (ETag / Last-Modified)
+    and updated from the response; None is returned if the server answers 304 Not Modified.
+    Pass a connection from `open_ha_connection` as `conn` to reuse it across calls.
+    """
+    if conn is None:
+        with _ha_conn(base_url, insecure_ssl) as conn:
+            return ha_fetch_entity_picture_bytes(
+                base_url, token, entity_id, insecure_ssl=insecure_ssl, validators=validators, conn=conn
+            )
+    url = ha_get_entity_picture_url(base_url, token, entity_id, insecure_ssl=insecure_ssl, conn=conn)
+    extra_headers: dict[str, str] = {}
+    if validators and validators.get("url") == url:
+        if validators.get("etag"):
+            extra_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            extra_headers["If-Modified-Since"] = validators["last_modified"]
+    status, body, headers = _http_get(url, token, insecure_ssl=insecure_ssl, conn=conn, extra_headers=extra_headers)
+    if status == 304:
+        return None
+    if validators is not None:
+        validators.clear()
+        validators.update(
+            url=url,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+    return body
 
 
 @dataclass(frozen=True)
@@ -77,12 +242,26 @@ class HomeAssistantWS:
     """
     Minimal Home Assistant WebSocket client (auth + subscribe state_changed).
     Requires `websockets` package.
+    permessage-deflate is off by default: HA events are small JSON frames, so
+    compression costs more CPU than the bandwidth it saves. Pass
+    compression="deflate" to re-enable it.
     """
 
-    def __init__(self, base_url: str, token: str, *, ping_interval_s: float = 30.0):
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        *,
+        ping_interval_s: float = 30.0,
+        compression: Optional[str] = None,
+        queue_size: int = 256,
+    ):
         self.base_url = normalize_base_url(base_url)
         self.token = token
+        self._auth_message = _dumps({"type": "auth", "access_token": token})
         self.ping_interval_s = max(5.0, float(ping_interval_s))
+        self.compression = compression
+        self.queue_size = max(1, int(queue_size))
         self._next_id = 1
 
     def _next(self) -> int:
@@ -97,69 +276,131 @@ class HomeAssistantWS:
             raise ImportError("Missing dependency: websockets. Install with: pip install websockets") from e
 
         ws_url = to_ws_url(self.base_url)
-        ws = await websockets.connect(ws_url, ping_interval=None)
+        ws = await websockets.connect(ws_url, ping_interval=None, compression=self.compression)
 
         # Handshake
-        msg = json.loads(await ws.recv())
+        msg = _loads(await ws.recv())
         if msg.get("type") != "auth_required":
             await ws.close()
             raise RuntimeError(f"Unexpected first WS message: {msg}")
-        await ws.send(json.dumps({"type": "auth", "access_token": self.token}))
-        msg = json.loads(await ws.recv())
+        await ws.send(self._auth_message)
+        msg = _loads(await ws.recv())
         if msg.get("type") != "auth_ok":
             await ws.close()
             raise RuntimeError(f"Auth failed: {msg}")
 
         return ws
 
+    async def _subscribe(self, ws, payload: dict[str, Any]) -> int:
+        sub_id = self._next()
+        await ws.send(_dumps({"id": sub_id, **payload}))
+        res = _loads(await ws.recv())
+        if res.get("type") != "result" or res.get("id") != sub_id or not res.get("success"):
+            raise RuntimeError(f"Failed to subscribe: {res}")
+        return sub_id
+
     async def subscribe_state_changed(
         self,
         *,
         entity_id: Optional[str] = None,
+        on_subscribed: Optional[Callable[[], None]] = None,
     ) -> AsyncIterator[HassStateChangedEvent]:
+        """`on_subscribed` is called once auth and the subscription have succeeded."""
         ws = await self.connect()
-        sub_id = self._next()
-        await ws.send(json.dumps({"id": sub_id, "type": "subscribe_events", "event_type": "state_changed"}))
-        res = json.loads(await ws.recv())
-        if res.get("type") != "result" or res.get("id") != sub_id or not res.get("success"):
-            await ws.close()
-            raise RuntimeError(f"Failed to subscribe: {res}")
+        sub_id = None
+        if entity_id:
+            # Let HA filter by entity; subscribe_trigger needs an admin token, so fall back if refused.
+            try:
+                sub_id = await self._subscribe(
+                    ws, {"type": "subscribe_trigger", "trigger": {"platform": "state", "entity_id": entity_id}}
+                )
+            except RuntimeError:
+                sub_id = None
+        if sub_id is None:
+            try:
+                sub_id = await self._subscribe(ws, {"type": "subscribe_events", "event_type": "state_changed"})
+            except RuntimeError:
+                await ws.close()
+                raise
+        if on_subscribed is not None:
+            on_subscribed()
 
         async def ping_loop():
             while True:
                 await asyncio.sleep(self.ping_interval_s)
                 try:
-                    await ws.send(json.dumps({"id": self._next(), "type": "ping"}))
+                    await ws.send(_PING_TEMPLATE % self._next())
                 except Exception:
                     return
 
+        # Frames are read ahead of the consumer; if it falls behind, the oldest are dropped.
+        # Other entities are filtered out first, so the subscribe_events firehose can't push
+        # the watched entity's transitions out of the queue.
+        frames: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        entity_marker = f'"{entity_id}"' if entity_id else None
+
+        async def reader_loop():
+            closing: Optional[BaseException] = None
+            try:
+                async for raw in ws:
+                    is_bytes = isinstance(raw, bytes)
+                    if (b'"event"' if is_bytes else '"event"') not in raw[:48]:
+                        continue
+                    if entity_marker and (entity_marker.encode() if is_bytes else entity_marker) not in raw:
+                        continue
+                    _put_latest(frames, raw)
+            except Exception as e:
+                closing = e
+            _put_latest(frames, closing)
+
         ping_task = asyncio.create_task(ping_loop())
+        reader_task = asyncio.create_task(reader_loop())
         try:
-            async for raw in ws:
-                msg = json.loads(raw)
+            while True:
+                raw = await frames.get()
+                if raw is None:
+                    break
+                if isinstance(raw, BaseException):
+                    raise raw
+                msg = _loads(raw)
                 if msg.get("type") != "event" or msg.get("id") != sub_id:
                     continue
                 ev = msg.get("event") or {}
-                data = ev.get("data") or {}
-                ent = data.get("entity_id")
+                trigger = (ev.get("variables") or {}).get("trigger")
+                if trigger is not None:
+                    ent = trigger.get("entity_id")
+                    old_state = trigger.get("from_state")
+                    new_state = trigger.get("to_state")
+                else:
+                    data = ev.get("data") or {}
+                    ent = data.get("entity_id")
+                    old_state = data.get("old_state")
+                    new_state = data.get("new_state")
                 if not ent:
                     continue
                 if entity_id and ent != entity_id:
                     continue
                 yield HassStateChangedEvent(
                     entity_id=ent,
-                    old_state=data.get("old_state"),
-                    new_state=data.get("new_state"),
+                    old_state=old_state,
+                    new_state=new_state,
                     raw=msg,
                 )
         finally:
             ping_task.cancel()
+            reader_task.cancel()
             try:
                 await ws.close()
             except Exception:
                 pass
 
 
+def _put_latest(queue: asyncio.Queue, item: Any) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
 async def watch_state_changes_forever(
     base_url: str,
     token: str,
@@ -167,21 +408,30 @@ async def watch_state_changes_forever(
     entity_id: str,
     on_event,
     reconnect_delay_s: float = 2.0,
+    max_reconnect_delay_s: float = 60.0,
 ) -> None:
     """
     Convenience loop with reconnect handling.
     `on_event` is an async function taking HassStateChangedEvent.
+    Reconnect delay doubles after each failure (capped at `max_reconnect_delay_s`)
+    and resets once a connection is authenticated and subscribed.
     """
 
-    delay = max(0.5, float(reconnect_delay_s))
+    initial_delay = max(0.5, float(reconnect_delay_s))
+    max_delay = max(initial_delay, float(max_reconnect_delay_s))
+    delay = initial_delay
+    client = HomeAssistantWS(base_url, token)
+
+    def reset_delay() -> None:
+        nonlocal delay
+        delay = initial_delay
+
     while True:
         try:
-            client = HomeAssistantWS(base_url, token)
-            async for ev in client.subscribe_state_changed(entity_id=entity_id):
+            async for ev in client.subscribe_state_changed(entity_id=entity_id, on_subscribed=reset_delay):
                 await on_event(ev)
         except asyncio.CancelledError:
             raise
         except Exception:
             await asyncio.sleep(delay)
-
-
+            delay = min(delay * 2, max_delay)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
-from io import BytesIO
 from typing import List, Optional
 from PIL import Image
 from .config import AppConfig, PanelDescriptor
@@ -54,6 +53,8 @@ class PanelManager:
             rotation=self.config.device.rotate,
             brightness=self.config.device.brightness,
             mtu=self.config.device.mtu,
+            write_without_response=self.config.device.write_without_response,
+            rgb565=self.config.device.rgb565,
             log_notifications=self.config.display.log_notifications,
             max_retries=self.config.display.max_retries,
             scan_timeout=self.config.device.scan_timeout,
@@ -73,6 +74,8 @@ class PanelManager:
                 rotation=rotation,
                 brightness=brightness,
                 mtu=self.config.device.mtu,
+                write_without_response=self.config.device.write_without_response,
+                rgb565=self.config.device.rgb565,
                 log_notifications=self.config.display.log_notifications,
                 max_retries=self.config.display.max_retries,
                 scan_timeout=self.config.device.scan_timeout,
@@ -84,15 +87,13 @@ class PanelManager:
         await session.__aenter__()
         self.sessions.append(PanelSession(descriptor, session))
 
-    async def send_image(self, image: Image.Image, delay: float = 0.2) -> None:
+    async def send_image(self, image: Image.Image, delay: float = 0.2, force: bool = False) -> None:
         if self.multi_panel:
-            await self._send_multi(image, delay)
+            await self._send_multi(image, delay, force)
         else:
-            buffer = BytesIO()
-            image.save(buffer, format="PNG", optimize=False)
-            await self.sessions[0].session.send_png(buffer.getvalue(), delay)
+            await self.sessions[0].session.send_image(image, delay, force)
 
-    async def _send_multi(self, image: Image.Image, delay: float) -> None:
+    async def _send_multi(self, image: Image.Image, delay: float, force: bool = False) -> None:
         expected_width, expected_height = self.canvas_size
         if image.size != (expected_width, expected_height):
             image = image.resize((expected_width, expected_height))
@@ -106,8 +107,6 @@ class PanelManager:
             right = left + self.tile_width
             bottom = top + self.tile_height
             region = image.crop((left, top, right, bottom))
-            buffer = BytesIO()
-            region.save(buffer, format="PNG", optimize=False)
-            tasks.append(panel_session.session.send_png(buffer.getvalue(), delay))
+            tasks.append(panel_session.session.send_image(region, delay, force))
         await asyncio.gather(*tasks)
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
+import functools
 import math
 from pathlib import Path
 from typing import Optional
 from PIL import Image, ImageDraw, ImageFont
 
 
+@functools.lru_cache(maxsize=16)
 def load_font(path: Optional[Path], size: int) -> ImageFont.ImageFont:
     if path is None:
         return ImageFont.load_default()
@@ -17,9 +17,19 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from bk_light.display_session import BleDisplaySession, build_frame
+from bk_light.event_loop import run_async
 
 MIN_FRAME_INTERVAL = 0.08
 
+INDEX_CONTENT = b"<!DOCTYPE html><html><head><title>BLE Panel Server</title></head><body><h1>BLE Panel Server</h1><p>Server is running. Connect via WebSocket to send frames.</p></body></html>"
+INDEX_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/html; charset=utf-8\r\n"
+    b"Content-Length: " + str(len(INDEX_CONTENT)).encode() + b"\r\n"
+    b"Connection: close\r\n\r\n" + INDEX_CONTENT
+)
+NOT_FOUND_RESPONSE = b"HTTP/1.1 404 Not Found\r\nConnection: close\r\n\r\nNot found"
+
 panel_address = None
 panel = None
 last_frame_time = 0
@@ -29,8 +39,34 @@ def is_valid_png(data: bytes) -> bool:
     return len(data) >= 8 and data[:8] == b"\x89PNG\r\n\x1a\n"
 
 
+async def sender_loop(send_q: asyncio.Queue):
+    global last_frame_time
+    loop = asyncio.get_running_loop()
+    while True:
+        frame = await send_q.get()
+        wait = MIN_FRAME_INTERVAL - (loop.time() - last_frame_time)
+        if wait > 0:
+            await asyncio.sleep(wait)
+            try:
+                frame = send_q.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        if not panel:
+            continue
+        last_frame_time = loop.time()
+        try:
+            await panel.send_frame(frame, delay=0.1)
+        except Exception as e:
+            print(f"Error sending frame: {e}")
+            if "not connected" in str(e).lower() or "disconnected" in str(e).lower():
+                try:
+                    await panel._connect()
+                except:
+                    pass
+
+
 async def handle_websocket(websocket):
-    global panel, last_frame_time
+    global panel
     print(f"Client connected: {websocket.remote_address}")
     
     if not panel:
@@ -46,31 +82,31 @@ async def handle_websocket(websocket):
             print(f"Failed to connect to panel: {e}")
             await websocket.close()
             return
-    
+
+    # Only the freshest frame is kept; stale ones are dropped while BLE is busy.
+    send_q: asyncio.Queue = asyncio.Queue(maxsize=1)
+    sender_task = asyncio.create_task(sender_loop(send_q))
     try:
         async for message in websocket:
             if not isinstance(message, bytes) or not panel:
                 continue
             if not is_valid_png(message):
                 continue
-            now = asyncio.get_event_loop().time()
-            if now - last_frame_time >= MIN_FRAME_INTERVAL:
-                last_frame_time = now
-                try:
-                    frame = build_frame(message)
-                    await panel.send_frame(frame, delay=0.1)
-                except Exception as e:
-                    print(f"Error sending frame: {e}")
-                    if "not connected" in str(e).lower() or "disconnected" in str(e).lower():
-                        try:
-                            await panel._connect()
-                        except:
-                            pass
+            try:
+                send_q.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            send_q.put_nowait(build_frame(message))
     except websockets.exceptions.ConnectionClosed:
         pass
     except Exception as e:
         print(f"WebSocket error: {e}")
     finally:
+        sender_task.cancel()
+        try:
+            await sender_task
+        except asyncio.CancelledError:
+            pass
         if panel:
             await panel._safe_disconnect()
             panel = None
@@ -80,28 +116,14 @@ async def handle_websocket(websocket):
 async def handle_http(reader, writer):
     try:
         data = await reader.read(4096)
-        request = data.decode("utf-8", errors="ignore")
 
         path = None
-        for line in request.split("\n"):
-            if line.startswith("GET "):
-                parts = line.split()
-                if len(parts) >= 2:
-                    path = parts[1]
-                break
-
-        if path == "/":
-            content = b"<!DOCTYPE html><html><head><title>BLE Panel Server</title></head><body><h1>BLE Panel Server</h1><p>Server is running. Connect via WebSocket to send frames.</p></body></html>"
-            response = (
-                b"HTTP/1.1 200 OK\r\n"
-                b"Content-Type: text/html; charset=utf-8\r\n"
-                b"Content-Length: " + str(len(content)).encode() + b"\r\n"
-                b"Connection: close\r\n\r\n" + content
-            )
-        else:
-            response = b"HTTP/1.1 404 Not Found\r\nConnection: close\r\n\r\nNot found"
-
-        writer.write(response)
+        end = data.find(b"\r\n")
+        parts = data[: end if end >= 0 else len(data)].split(b" ", 2)
+        if len(parts) >= 2 and parts[0] == b"GET":
+            path = parts[1].decode("ascii", errors="ignore")
+
+        writer.write(INDEX_RESPONSE if path == "/" else NOT_FOUND_RESPONSE)
         await writer.drain()
     except Exception as e:
         print(f"HTTP error: {e}")
@@ -143,6 +165,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_async(main())
     except KeyboardInterrupt:
         print("\nStopped")
@@ -1,8 +1,9 @@
 import argparse
 import asyncio
+import functools
 import sys
 from dataclasses import replace
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 from PIL import Image, ImageDraw, ImageFont
@@ -12,6 +13,7 @@ if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
 from bk_light.config import AppConfig, clock_options, load_config
+from bk_light.event_loop import run_async
 from bk_light.fonts import get_font_profile, resolve_font
 from bk_light.panel_manager import PanelManager
 
@@ -24,10 +26,11 @@ def parse_color(value: Optional[str]) -> Optional[tuple[int, int, int]]:
         parts = cleaned.split(",")
         return tuple(int(part) for part in parts[:3])
     if len(cleaned) == 6:
-        return tuple(int(cleaned[i:i + 2], 16) for i in (0, 2, 4))
+        return tuple(bytes.fromhex(cleaned))
     raise ValueError("Invalid color")
 
 
+@functools.lru_cache(maxsize=16)
 def load_font(path: Optional[Path], size: int) -> ImageFont.ImageFont:
     if path is None:
         return ImageFont.load_default()
@@ -48,22 +51,13 @@ def resolve_timezone(config: AppConfig, override: Optional[str]) -> timezone:
         return datetime.now().astimezone().tzinfo or timezone.utc
 
 
-def build_clock_image(
-    canvas: tuple[int, int],
-    text: str,
-    color: tuple[int, int, int],
-    accent: tuple[int, int, int],
-    background: tuple[int, int, int],
+@functools.lru_cache(maxsize=4)
+def build_digit_glyphs(
     font_path: Optional[Path],
     size: int,
-    colon_visible: bool,
+    color: tuple[int, int, int],
     antialias: bool,
-    offset_x: int,
-    offset_y: int,
-    colon_dx: int,
-    colon_top_adjust: int,
-    colon_bottom_adjust: int,
-) -> Image.Image:
+) -> tuple[dict[str, Image.Image], dict[str, tuple[int, int, int, int]], int, int, int]:
     font = load_font(font_path, size)
     mask_mode = "L" if antialias else "1"
     dummy = Image.new(mask_mode, (1, 1), 0)
@@ -96,6 +90,29 @@ def build_clock_image(
     if digit_top is None or digit_bottom is None:
         digit_top = 0
         digit_bottom = size
+    return digit_glyphs, digit_bboxes, max_digit_width, digit_top, digit_bottom
+
+
+@functools.lru_cache(maxsize=4)
+def build_clock_image(
+    canvas: tuple[int, int],
+    text: str,
+    color: tuple[int, int, int],
+    accent: tuple[int, int, int],
+    background: tuple[int, int, int],
+    font_path: Optional[Path],
+    size: int,
+    colon_visible: bool,
+    antialias: bool,
+    offset_x: int,
+    offset_y: int,
+    colon_dx: int,
+    colon_top_adjust: int,
+    colon_bottom_adjust: int,
+) -> Image.Image:
+    digit_glyphs, digit_bboxes, max_digit_width, digit_top, digit_bottom = build_digit_glyphs(
+        font_path, size, color, antialias
+    )
     digit_height = max(1, digit_bottom - digit_top)
     def render_segment(segment: str) -> Image.Image:
         if not segment:
@@ -154,9 +171,7 @@ def build_clock_image(
                 if 0 <= row < canvas[1]:
                     frame_rgb.putpixel((colon_column, row), accent)
         else:
-            for row in range(top, bottom + 1):
-                if 0 <= row < canvas[1]:
-                    frame_rgb.putpixel((colon_column, row), background)
+            frame_rgb.paste(background, (colon_column, top, colon_column + 1, bottom + 1))
     return frame_rgb
 
 
@@ -176,7 +191,6 @@ async def run_clock(config: AppConfig, preset_name: str, overrides: dict[str, Op
     else:
         size = preset.size
     size = max(1, int(round(size)))
-    interval = preset.interval
     dot_flashing = preset.dot_flashing
     flash_period = preset.dot_flash_period
     last_stamp = ""
@@ -218,7 +232,13 @@ async def run_clock(config: AppConfig, preset_name: str, overrides: dict[str, Op
                     await manager.send_image(image, delay=0.15)
                     last_stamp = stamp
                     last_colon = colon_visible
-                await asyncio.sleep(interval)
+                # Sleep until the next minute rollover or colon toggle instead of polling.
+                next_minute = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+                sleep_s = (next_minute - datetime.now(tz)).total_seconds()
+                if dot_flashing:
+                    elapsed = loop.time() - start_time
+                    sleep_s = min(sleep_s, flash_period - elapsed % flash_period)
+                await asyncio.sleep(max(0.0, sleep_s) + 0.01)
     except asyncio.CancelledError:
         raise
     except Exception as error:
@@ -237,7 +257,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--background")
     parser.add_argument("--font", type=Path)
     parser.add_argument("--size", type=int)
-    parser.add_argument("--interval", type=float)
+    parser.add_argument(
+        "--interval",
+        type=float,
+        help="Deprecated, ignored: the clock redraws on minute rollover and colon toggles",
+    )
     parser.add_argument("--dot-flashing", choices=("on", "off"))
     parser.add_argument("--dot-flash-period", type=float)
     return parser.parse_args()
@@ -270,7 +294,7 @@ if __name__ == "__main__":
     preset_name = args.preset or config.runtime.preset or "default"
     overrides = build_override_map(args)
     try:
-        asyncio.run(run_clock(config, preset_name, overrides))
+        run_async(run_clock(config, preset_name, overrides))
     except KeyboardInterrupt:
         pass
 
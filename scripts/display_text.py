@@ -11,6 +11,7 @@ if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
 from bk_light.config import AppConfig, load_config, text_options
+from bk_light.event_loop import run_async
 from bk_light.fonts import get_font_profile, resolve_font
 from bk_light.panel_manager import PanelManager
 from bk_light.text import build_text_bitmap
@@ -24,7 +25,7 @@ def parse_color(value: Optional[str]) -> Optional[tuple[int, int, int]]:
         parts = cleaned.split(",")
         return tuple(int(part) for part in parts[:3])
     if len(cleaned) == 6:
-        return tuple(int(cleaned[i:i + 2], 16) for i in (0, 2, 4))
+        return tuple(bytes.fromhex(cleaned))
     raise ValueError("Invalid color")
 
 
@@ -53,19 +54,20 @@ def render_scroll_frame(
     position: int,
 ) -> Image.Image:
     strip_width = max(1, text_bitmap.width + gap)
-    strip = Image.new("RGBA", (strip_width, canvas[1]), tuple(background) + (255,))
+    # The strip is opaque, so tiles are plain copies rather than per-pixel alpha blends.
+    strip = Image.new("RGB", (strip_width, canvas[1]), tuple(background))
     y = (canvas[1] - text_bitmap.height) // 2 + offset_y
     strip.paste(text_bitmap, (0, y), text_bitmap)
     shift = position % strip_width
     start = offset_x - shift if direction == "left" else offset_x + shift
     while start > -strip_width:
         start -= strip_width
-    frame = Image.new("RGBA", canvas, tuple(background) + (255,))
+    frame = Image.new("RGB", canvas, tuple(background))
     x = start
     while x < canvas[0]:
-        frame.paste(strip, (int(x), 0), strip)
+        frame.paste(strip, (int(x), 0))
         x += strip_width
-    return frame.convert("RGB")
+    return frame
 
 
 async def display_text(config: AppConfig, message: str, preset_name: str, overrides: dict[str, Optional[str]]) -> None:
@@ -186,7 +188,7 @@ if __name__ == "__main__":
     preset_name = args.preset or config.runtime.preset or "default"
     overrides = build_override_map(args)
     try:
-        asyncio.run(display_text(config, args.text, preset_name, overrides))
+        run_async(display_text(config, args.text, preset_name, overrides))
     except KeyboardInterrupt:
         pass
 
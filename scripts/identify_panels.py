@@ -61,6 +61,8 @@ async def display_panel(index: int, descriptor: PanelDescriptor, config: AppConf
         rotation=rotation,
         brightness=brightness,
         mtu=config.device.mtu,
+        write_without_response=config.device.write_without_response,
+        rgb565=config.device.rgb565,
         log_notifications=config.display.log_notifications,
     )
     try:
@@ -22,7 +22,7 @@ def parse_color(value: str) -> tuple[int, int, int]:
         parts = cleaned.split(",")
         return tuple(int(part) for part in parts[:3])
     if len(cleaned) == 6:
-        return tuple(int(cleaned[i:i + 2], 16) for i in (0, 2, 4))
+        return tuple(bytes.fromhex(cleaned))
     raise ValueError("Invalid color")
 
 
@@ -1,5 +1,4 @@
 import argparse
-import asyncio
 import sys
 from dataclasses import replace
 from pathlib import Path
@@ -9,6 +8,7 @@ if __package__ is None or __package__ == "":
     sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from bk_light.config import AppConfig, load_config
+from bk_light.event_loop import run_async
 
 
 def parse_cli_value(value: str):
@@ -108,5 +108,5 @@ if __name__ == "__main__":
     mode = args.mode or config.runtime.mode or "clock"
     preset_name = args.preset or config.runtime.preset or "default"
     options = merge_options(config, args)
-    asyncio.run(run_mode(config, mode, preset_name, options))
+    run_async(run_mode(config, mode, preset_name, options))
 
@@ -4,18 +4,24 @@ import sys
 from dataclasses import replace
 from pathlib import Path
 from io import BytesIO
-import json
 import ssl
+from functools import lru_cache
 from urllib.parse import quote, urljoin
-from urllib.request import Request, urlopen
+from urllib.request import HTTPSHandler, OpenerDirector, Request, build_opener
 from typing import Optional
-from PIL import Image, ImageOps
+from PIL import Image
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 project_root = Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
 from bk_light.config import AppConfig, image_options, load_config
+from bk_light.cover_art import RESAMPLE_BY_QUALITY, fit_to_canvas
 from bk_light.panel_manager import PanelManager
 
 
@@ -23,30 +29,6 @@ def parse_bool(value: Optional[bool]) -> Optional[bool]:
     return value if value is not None else None
 
 
-def prepare_image_obj(
-    image: Image.Image,
-    canvas: tuple[int, int],
-    mode: str,
-    rotate: int,
-    mirror: bool,
-    invert: bool,
-) -> Image.Image:
-    image = image.convert("RGB")
-    if rotate:
-        image = image.rotate(rotate % 360, expand=False)
-    if mirror:
-        image = ImageOps.mirror(image)
-    if invert:
-        image = ImageOps.invert(image)
-    if mode == "fit":
-        image = ImageOps.fit(image, canvas, method=Image.Resampling.LANCZOS)
-    elif mode == "cover":
-        image = ImageOps.fit(image, canvas, method=Image.Resampling.BICUBIC)
-    else:
-        image = image.resize(canvas, Image.Resampling.LANCZOS)
-    return image
-
-
 def _normalize_base_url(base_url: str) -> str:
     base_url = (base_url or "").strip().rstrip("/")
     if not base_url.startswith(("http://", "https://")):
@@ -61,21 +43,26 @@ def _to_absolute_url(base_url: str, maybe_relative: str) -> str:
     return urljoin(base_url + "/", maybe_relative.lstrip("/"))
 
 
+@lru_cache(maxsize=2)
+def _opener(insecure_ssl: bool) -> OpenerDirector:
+    context = ssl._create_unverified_context() if insecure_ssl else ssl.create_default_context()
+    return build_opener(HTTPSHandler(context=context))
+
+
 def _http_get_bytes(url: str, token: str, *, insecure_ssl: bool = False) -> bytes:
     headers = {
         "Authorization": f"Bearer {token}",
         "User-Agent": "bk-light-send-image/1.0",
     }
     req = Request(url, headers=headers, method="GET")
-    context = ssl._create_unverified_context() if insecure_ssl else None
-    with urlopen(req, context=context, timeout=20) as resp:
+    with _opener(insecure_ssl).open(req, timeout=20) as resp:
         return resp.read()
 
 
 def _ha_get_state(base_url: str, token: str, entity_id: str, *, insecure_ssl: bool = False) -> dict:
     url = _to_absolute_url(base_url, f"/api/states/{quote(entity_id)}")
     raw = _http_get_bytes(url, token, insecure_ssl=insecure_ssl)
-    return json.loads(raw.decode("utf-8"))
+    return _json_loads(raw)
 
 
 def _ha_get_entity_picture_url(base_url: str, token: str, entity_id: str, *, insecure_ssl: bool = False) -> str:
@@ -98,6 +85,7 @@ async def send_image(
     ha_token: Optional[str] = None,
     ha_entity: Optional[str] = None,
     ha_insecure_ssl: bool = False,
+    quality: str = "fast",
 ) -> None:
     preset = image_options(config, preset_name, overrides)
     rotate_override = overrides.get("rotate")
@@ -113,14 +101,21 @@ async def send_image(
             if not ha_base_url or not ha_token:
                 raise ValueError("--ha-base-url and --ha-token are required when using --ha-entity")
             base_url = _normalize_base_url(ha_base_url)
-            url = _ha_get_entity_picture_url(base_url, ha_token, ha_entity, insecure_ssl=ha_insecure_ssl)
-            img_bytes = _http_get_bytes(url, ha_token, insecure_ssl=ha_insecure_ssl)
+            url = await asyncio.to_thread(
+                _ha_get_entity_picture_url, base_url, ha_token, ha_entity, insecure_ssl=ha_insecure_ssl
+            )
+            img_bytes = await asyncio.to_thread(_http_get_bytes, url, ha_token, insecure_ssl=ha_insecure_ssl)
             pil = Image.open(BytesIO(img_bytes))
         else:
             if source is None:
                 raise ValueError("Missing image path (or pass --ha-entity to fetch from Home Assistant)")
             pil = Image.open(source)
-        image = prepare_image_obj(pil, canvas, mode, rotate, mirror, invert)
+        if pil.format == "JPEG":
+            # Let libjpeg downscale during decode; only canvas-sized pixels are needed.
+            pil.draft("RGB", canvas)
+        if pil.mode != "RGB":
+            pil = pil.convert("RGB")
+        image = fit_to_canvas(pil, canvas, mode, rotate, mirror, invert, RESAMPLE_BY_QUALITY[quality])
         await manager.send_image(image, delay=max(0.0, float(ble_delay)))
         await asyncio.sleep(0.2)
 
@@ -135,6 +130,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--rotate", type=int)
     parser.add_argument("--mirror", action="store_true")
     parser.add_argument("--invert", action="store_true")
+    parser.add_argument(
+        "--quality",
+        choices=tuple(RESAMPLE_BY_QUALITY),
+        default="fast",
+        help="Cover art resampling: fast (bilinear) or high (Lanczos). Default: fast",
+    )
     parser.add_argument(
         "--ble-delay",
         type=float,
@@ -185,6 +186,7 @@ if __name__ == "__main__":
             ha_entity=args.ha_entity,
             ha_insecure_ssl=args.ha_insecure_ssl,
             ble_delay=args.ble_delay,
+            quality=args.quality,
         )
     )
 
@@ -1,6 +1,9 @@
 import argparse
 import asyncio
+import functools
+import math
 import sys
+from array import array
 from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
@@ -13,6 +16,7 @@ if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
 from bk_light.config import AppConfig, load_config
+from bk_light.event_loop import run_async
 from bk_light.panel_manager import PanelManager
 
 SPRITE_SIZE = 16
@@ -32,10 +36,35 @@ def resolve_timezone(config: AppConfig, override: Optional[str]) -> timezone:
         return datetime.now().astimezone().tzinfo or timezone.utc
 
 
+# Minute of day -> sprite index; sprite 0 (noon) is offset by 12 hours.
+CLOCK_INDEX_BY_MINUTE = array(
+    "B", (int(((minute + 720) % 1440) / 1440 * SPRITE_COUNT) for minute in range(1440))
+)
+
+
 def get_clock_index(now: datetime) -> int:
-    total_minutes = now.hour * 60 + now.minute
-    normalized_minutes = (total_minutes + 720) % 1440
-    return int(normalized_minutes / 1440 * SPRITE_COUNT)
+    return CLOCK_INDEX_BY_MINUTE[now.hour * 60 + now.minute]
+
+
+def seconds_until_next_index(now: datetime) -> float:
+    normalized_minutes = (now.hour * 60 + now.minute + 720) % 1440
+    minutes_per_sprite = 1440 / SPRITE_COUNT
+    next_minute = math.ceil((get_clock_index(now) + 1) * minutes_per_sprite)
+    return (next_minute - normalized_minutes) * 60 - now.second - now.microsecond / 1_000_000
+
+
+@functools.lru_cache(maxsize=2)
+def load_sprite_sheet(sheet_path: Path) -> Image.Image:
+    # Converted once per process so per-frame crops are already RGB.
+    sprite_sheet = Image.open(sheet_path).convert("RGB")
+    min_w = SPRITE_SIZE * SPRITES_PER_ROW
+    min_h = SPRITE_SIZE * (SPRITE_COUNT // SPRITES_PER_ROW)
+    if sprite_sheet.width < min_w or sprite_sheet.height < min_h:
+        raise ValueError(
+            f"Sprite sheet is too small ({sprite_sheet.width}x{sprite_sheet.height}). "
+            f"Expected at least {min_w}x{min_h} for 8x8 sprites."
+        )
+    return sprite_sheet
 
 
 def render_minecraft_clock_sprite(
@@ -44,7 +73,8 @@ def render_minecraft_clock_sprite(
     idx = max(0, min(SPRITE_COUNT - 1, int(index)))
     left = (idx % SPRITES_PER_ROW) * SPRITE_SIZE
     top = (idx // SPRITES_PER_ROW) * SPRITE_SIZE
-    return sprite_sheet.crop((left, top, left + SPRITE_SIZE, top + SPRITE_SIZE)).convert("RGB")
+    sprite = sprite_sheet.crop((left, top, left + SPRITE_SIZE, top + SPRITE_SIZE))
+    return sprite if sprite.mode == "RGB" else sprite.convert("RGB")
 
 
 def prepare_image_obj(
@@ -57,9 +87,12 @@ def prepare_image_obj(
 ) -> Image.Image:
     print(f"fill_mode: {fill_mode}")
 
-    image = image.convert("RGB")
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    # Sprites are 16x16, so orient them before upscaling to the canvas.
+    rotate %= 360
     if rotate:
-        image = image.rotate(rotate % 360, expand=False)
+        image = image.rotate(rotate, expand=False)
     if mirror:
         image = ImageOps.mirror(image)
     if invert:
@@ -78,15 +111,6 @@ async def run_clock(config: AppConfig, args: argparse.Namespace) -> None:
     if not sheet_path.exists():
         raise FileNotFoundError(f"Sprite sheet not found: {sheet_path}")
 
-    sprite_sheet = Image.open(sheet_path).convert("RGBA")
-    min_w = SPRITE_SIZE * SPRITES_PER_ROW
-    min_h = SPRITE_SIZE * (SPRITE_COUNT // SPRITES_PER_ROW)
-    if sprite_sheet.width < min_w or sprite_sheet.height < min_h:
-        raise ValueError(
-            f"Sprite sheet is too small ({sprite_sheet.width}x{sprite_sheet.height}). "
-            f"Expected at least {min_w}x{min_h} for 8x8 sprites."
-        )
-
     interval = float(args.interval)
     step = max(1, int(args.step))
     start_index = max(0, min(SPRITE_COUNT - 1, int(args.start_index)))
@@ -96,38 +120,54 @@ async def run_clock(config: AppConfig, args: argparse.Namespace) -> None:
     fill_mode = args.fill
     tz = resolve_timezone(config, args.timezone)
 
-    async with PanelManager(config) as manager:
-        canvas = manager.canvas_size
-        last_index: Optional[int] = None
-        cycle_index = start_index
-
-        while True:
-            if args.clock_mode == "index":
-                current_index = fixed_index
-            elif args.clock_mode == "cycle":
-                current_index = cycle_index
-                cycle_index = (cycle_index + step) % SPRITE_COUNT
-            else:
-                current_index = get_clock_index(datetime.now(tz))
-
-            if args.clock_mode != "realtime" or current_index != last_index:
-                frame = render_minecraft_clock_sprite(sprite_sheet, current_index)
-
-                image = prepare_image_obj(
-                    frame,
-                    canvas,
-                    fill_mode,
-                    rotate,
-                    bool(args.mirror),
-                    bool(args.invert),
-                )
-                await manager.send_image(image, delay=ble_delay)
-                last_index = current_index
-
-            if args.once or args.clock_mode == "index":
-                break
-
-            await asyncio.sleep(interval)
+    # Decode the sheet off the event loop while the panel connects.
+    sheet_task = asyncio.create_task(asyncio.to_thread(load_sprite_sheet, sheet_path))
+    try:
+        async with PanelManager(config) as manager:
+            canvas = manager.canvas_size
+            sprite_sheet = await sheet_task
+            last_index: Optional[int] = None
+            cycle_index = start_index
+            # Transform inputs are fixed for the run, so each of the 64 frames is prepared once.
+            prepared: dict[int, Image.Image] = {}
+
+            while True:
+                if args.clock_mode == "index":
+                    current_index = fixed_index
+                elif args.clock_mode == "cycle":
+                    current_index = cycle_index
+                    cycle_index = (cycle_index + step) % SPRITE_COUNT
+                else:
+                    current_index = get_clock_index(datetime.now(tz))
+
+                if args.clock_mode != "realtime" or current_index != last_index:
+                    image = prepared.get(current_index)
+                    if image is None:
+                        frame = render_minecraft_clock_sprite(sprite_sheet, current_index)
+                        image = prepare_image_obj(
+                            frame,
+                            canvas,
+                            fill_mode,
+                            rotate,
+                            bool(args.mirror),
+                            bool(args.invert),
+                        )
+                        prepared[current_index] = image
+                    await manager.send_image(image, delay=ble_delay)
+                    last_index = current_index
+
+                if args.once or args.clock_mode == "index":
+                    break
+
+                if args.clock_mode == "realtime":
+                    # The sprite only changes every 22.5 minutes; sleep until then.
+                    await asyncio.sleep(max(interval, seconds_until_next_index(datetime.now(tz)) + 0.05))
+                else:
+                    await asyncio.sleep(interval)
+    finally:
+        # Also reached when the panel connect fails; reap the decode so its error is not orphaned.
+        sheet_task.cancel()
+        await asyncio.gather(sheet_task, return_exceptions=True)
 
 
 def parse_args() -> argparse.Namespace:
@@ -169,7 +209,7 @@ def parse_args() -> argparse.Namespace:
         "--interval",
         type=float,
         default=1.0,
-        help="Seconds between updates (realtime/cycle). Use 0.25 to match JS cycle speed.",
+        help="Seconds between cycle updates (minimum sleep in realtime mode). Use 0.25 to match JS cycle speed.",
     )
     parser.add_argument("--timezone", help="Timezone name (e.g. Europe/Warsaw). Default: device.timezone")
     parser.add_argument(
@@ -188,7 +228,7 @@ if __name__ == "__main__":
     if args.address:
         config.device = replace(config.device, address=args.address)
     try:
-        asyncio.run(run_clock(config, args))
+        run_async(run_clock(config, args))
     except KeyboardInterrupt:
         pass
 
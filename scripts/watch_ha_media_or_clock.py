@@ -1,12 +1,14 @@
 import argparse
 import asyncio
 import contextlib
+import functools
 import hashlib
+import math
 import sys
 import time
+from array import array
 from dataclasses import replace
 from datetime import datetime, timezone
-from io import BytesIO
 from pathlib import Path
 from typing import Optional
 
@@ -17,11 +19,15 @@ if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
 from bk_light.config import AppConfig, image_options, load_config
+from bk_light.cover_art import RESAMPLE_BY_QUALITY, prepare_cover_image
+from bk_light.event_loop import run_async
 from bk_light.home_assistant import (
     HomeAssistantWS,
+    entity_picture_of,
     ha_fetch_entity_picture_bytes,
     ha_get_state,
     normalize_base_url,
+    open_ha_connection,
 )
 from bk_light.panel_manager import PanelManager
 
@@ -44,10 +50,21 @@ def resolve_timezone(config: AppConfig, override: Optional[str]) -> timezone:
         return datetime.now().astimezone().tzinfo or timezone.utc
 
 
+# Minute of day -> sprite index; sprite 0 (noon) is offset by 12 hours.
+CLOCK_INDEX_BY_MINUTE = array(
+    "B", (int(((minute + 720) % 1440) / 1440 * SPRITE_COUNT) for minute in range(1440))
+)
+
+
 def get_clock_index(now: datetime) -> int:
-    total_minutes = now.hour * 60 + now.minute
-    normalized_minutes = (total_minutes + 720) % 1440
-    return int(normalized_minutes / 1440 * SPRITE_COUNT)
+    return CLOCK_INDEX_BY_MINUTE[now.hour * 60 + now.minute]
+
+
+def seconds_until_next_index(now: datetime) -> float:
+    normalized_minutes = (now.hour * 60 + now.minute + 720) % 1440
+    minutes_per_sprite = 1440 / SPRITE_COUNT
+    next_minute = math.ceil((get_clock_index(now) + 1) * minutes_per_sprite)
+    return (next_minute - normalized_minutes) * 60 - now.second - now.microsecond / 1_000_000
 
 
 def get_dynamic_brightness(now: datetime) -> float:
@@ -66,11 +83,26 @@ def get_dynamic_brightness(now: datetime) -> float:
     return DAY_PEAK_BRIGHTNESS - (DAY_PEAK_BRIGHTNESS - NIGHT_BRIGHTNESS) * progress
 
 
+@functools.lru_cache(maxsize=2)
+def load_sprite_sheet(sheet_path: Path) -> Image.Image:
+    # Converted once per process so per-frame crops are already RGB.
+    sprite_sheet = Image.open(sheet_path).convert("RGB")
+    min_w = SPRITE_SIZE * SPRITES_PER_ROW
+    min_h = SPRITE_SIZE * (SPRITE_COUNT // SPRITES_PER_ROW)
+    if sprite_sheet.width < min_w or sprite_sheet.height < min_h:
+        raise ValueError(
+            f"Sprite sheet is too small ({sprite_sheet.width}x{sprite_sheet.height}). "
+            f"Expected at least {min_w}x{min_h} for 8x8 sprites."
+        )
+    return sprite_sheet
+
+
 def render_minecraft_clock_sprite(sprite_sheet: Image.Image, index: int) -> Image.Image:
     idx = max(0, min(SPRITE_COUNT - 1, int(index)))
     left = (idx % SPRITES_PER_ROW) * SPRITE_SIZE
     top = (idx // SPRITES_PER_ROW) * SPRITE_SIZE
-    return sprite_sheet.crop((left, top, left + SPRITE_SIZE, top + SPRITE_SIZE)).convert("RGB")
+    sprite = sprite_sheet.crop((left, top, left + SPRITE_SIZE, top + SPRITE_SIZE))
+    return sprite if sprite.mode == "RGB" else sprite.convert("RGB")
 
 
 def prepare_image_obj(
@@ -80,24 +112,20 @@ def prepare_image_obj(
     rotate: int,
     mirror: bool,
     invert: bool,
-    fit_resample: Image.Resampling,
-    cover_resample: Image.Resampling,
-    scale_resample: Image.Resampling,
+    resample: Image.Resampling,
 ) -> Image.Image:
-    image = image.convert("RGB")
-    if rotate:
+    # Clock sprites are 16x16, so orient them before upscaling to the canvas.
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    if rotate % 360:
         image = image.rotate(rotate % 360, expand=False)
     if mirror:
         image = ImageOps.mirror(image)
     if invert:
         image = ImageOps.invert(image)
-    if mode == "fit":
-        image = ImageOps.fit(image, canvas, method=fit_resample)
-    elif mode == "cover":
-        image = ImageOps.fit(image, canvas, method=cover_resample)
-    else:
-        image = image.resize(canvas, scale_resample)
-    return image
+    if mode in ("fit", "cover"):
+        return ImageOps.fit(image, canvas, method=resample)
+    return image.resize(canvas, resample)
 
 
 def build_override_map(args: argparse.Namespace) -> dict[str, object]:
@@ -128,19 +156,12 @@ async def run_watch(config: AppConfig, args: argparse.Namespace) -> None:
     min_interval = max(0.0, float(args.min_interval))
     clock_interval = max(0.05, float(args.clock_interval))
     ble_delay = max(0.0, float(args.ble_delay))
+    cover_resample = RESAMPLE_BY_QUALITY[args.quality]
     tz = resolve_timezone(config, args.timezone)
 
     sheet_path = args.sprite_sheet
     if not sheet_path.exists():
         raise FileNotFoundError(f"Sprite sheet not found: {sheet_path}")
-    sprite_sheet = Image.open(sheet_path).convert("RGBA")
-    min_w = SPRITE_SIZE * SPRITES_PER_ROW
-    min_h = SPRITE_SIZE * (SPRITE_COUNT // SPRITES_PER_ROW)
-    if sprite_sheet.width < min_w or sprite_sheet.height < min_h:
-        raise ValueError(
-            f"Sprite sheet is too small ({sprite_sheet.width}x{sprite_sheet.height}). "
-            f"Expected at least {min_w}x{min_h} for 8x8 sprites."
-        )
 
     preset_name = args.preset or config.runtime.preset or "default"
     overrides = build_override_map(args)
@@ -153,136 +174,220 @@ async def run_watch(config: AppConfig, args: argparse.Namespace) -> None:
     clock_mode = args.clock_fill or mode
 
     last_sent_cover_at = 0.0
-    last_cover_hash: Optional[str] = None
+    last_cover_hash: Optional[bytes] = None
+    last_cover_image: Optional[Image.Image] = None
+    cover_validators: dict[str, Optional[str]] = {}
     last_clock_index: Optional[int] = None
+    last_entity_picture: Optional[str] = None
     showing_cover = False
-    send_lock = asyncio.Lock()
-
-    async with PanelManager(config) as manager:
-        canvas = manager.canvas_size
-
-        def apply_dynamic_brightness() -> None:
-            brightness = get_dynamic_brightness(datetime.now(tz))
-            for panel_session in manager.sessions:
-                panel_session.session.brightness = brightness
-
-        async def send_cover(force: bool = False) -> None:
-            nonlocal last_sent_cover_at, last_cover_hash, last_clock_index, showing_cover
-
-            now = time.monotonic()
-            # Only throttle repeated cover updates; mode transitions should be immediate.
-            if not force and showing_cover and min_interval and (now - last_sent_cover_at) < min_interval:
-                return
-
-            img_bytes = await asyncio.to_thread(
-                ha_fetch_entity_picture_bytes,
-                base_url,
-                token,
-                entity_id,
-                insecure_ssl=bool(args.ha_insecure_ssl),
-            )
-            current_hash = hashlib.sha256(img_bytes).hexdigest()
-            if not force and showing_cover and last_cover_hash == current_hash:
-                return
-
-            pil = Image.open(BytesIO(img_bytes))
-            image = prepare_image_obj(
-                pil,
-                canvas,
-                mode,
-                rotate,
-                mirror,
-                invert,
-                fit_resample=Image.Resampling.LANCZOS,
-                cover_resample=Image.Resampling.LANCZOS,
-                scale_resample=Image.Resampling.LANCZOS,
-            )
-            async with send_lock:
-                apply_dynamic_brightness()
-                await manager.send_image(image, delay=ble_delay)
-                last_cover_hash = current_hash
-                last_sent_cover_at = time.monotonic()
-                showing_cover = True
-                last_clock_index = None
-
-        async def send_clock(force: bool = False) -> None:
-            nonlocal last_clock_index, showing_cover
-
-            clock_index = get_clock_index(datetime.now(tz))
-            if not force and clock_index == last_clock_index:
-                return
-
-            frame = render_minecraft_clock_sprite(sprite_sheet, clock_index)
-            image = prepare_image_obj(
-                frame,
-                canvas,
-                clock_mode,
-                rotate,
-                mirror,
-                invert,
-                fit_resample=Image.Resampling.BOX,
-                cover_resample=Image.Resampling.BOX,
-                scale_resample=Image.Resampling.BOX,
-            )
-            async with send_lock:
-                apply_dynamic_brightness()
-                await manager.send_image(image, delay=ble_delay)
-                last_clock_index = clock_index
-                showing_cover = False
+    # Latest-wins (frame, force) slot drained by flush_loop, so rapid clock/cover flips only send the final frame.
+    pending_frame: Optional[tuple[Image.Image, bool]] = None
+    frame_ready = asyncio.Event()
+    # Clock transform inputs are fixed for the run, so each of the 64 frames is prepared once.
+    prepared_clock_frames: dict[int, Image.Image] = {}
+
+    # One keep-alive REST connection for the whole run; HA calls below are sequential.
+    ha_conn = open_ha_connection(base_url, bool(args.ha_insecure_ssl))
+
+    # Sheet decode and the first HA state fetch don't depend on BLE; overlap them with the panel connect.
+    sheet_task = asyncio.create_task(asyncio.to_thread(load_sprite_sheet, sheet_path))
+    initial_state_task = asyncio.create_task(
+        asyncio.to_thread(
+            ha_get_state,
+            base_url,
+            token,
+            entity_id,
+            insecure_ssl=bool(args.ha_insecure_ssl),
+            conn=ha_conn,
+        )
+    )
 
-        async def refresh_by_state(force_cover: bool = False) -> None:
-            try:
-                state = await asyncio.to_thread(
-                    ha_get_state,
+    try:
+        async with PanelManager(config) as manager:
+            canvas = manager.canvas_size
+            sprite_sheet = await sheet_task
+
+            def apply_dynamic_brightness() -> None:
+                brightness = get_dynamic_brightness(datetime.now(tz))
+                for panel_session in manager.sessions:
+                    panel_session.session.brightness = brightness
+
+            def queue_frame(image: Image.Image, force: bool) -> None:
+                nonlocal pending_frame
+                pending_frame = (image, force)
+                frame_ready.set()
+
+            async def flush_loop() -> None:
+                nonlocal pending_frame, last_cover_hash, cover_validators, last_clock_index, last_entity_picture
+                while True:
+                    await frame_ready.wait()
+                    frame_ready.clear()
+                    pending, pending_frame = pending_frame, None
+                    if pending is None:
+                        continue
+                    image, force = pending
+                    try:
+                        apply_dynamic_brightness()
+                        await manager.send_image(image, delay=ble_delay, force=force)
+                    except Exception as e:
+                        print(f"[ble] frame send failed: {e}; retrying in {reconnect_delay:.1f}s")
+                        # Bookkeeping was committed at queue time; forget it so later events/ticks don't dedupe
+                        # against a frame the panel never got.
+                        last_cover_hash = None
+                        cover_validators = {}
+                        last_clock_index = None
+                        last_entity_picture = None
+                        await asyncio.sleep(reconnect_delay)
+                        # Retry unless a newer frame superseded this one meanwhile.
+                        if pending_frame is None:
+                            queue_frame(image, force)
+
+            async def send_cover(force: bool = False) -> bool:
+                nonlocal last_sent_cover_at, last_cover_hash, last_cover_image, cover_validators
+                nonlocal last_clock_index, showing_cover
+
+                now = time.monotonic()
+                # Only throttle repeated cover updates; mode transitions should be immediate.
+                if not force and showing_cover and min_interval and (now - last_sent_cover_at) < min_interval:
+                    return False
+
+                # Conditional GET only once there is a prepared cover to fall back on.
+                validators = dict(cover_validators) if last_cover_image is not None else {}
+                img_bytes = await asyncio.to_thread(
+                    ha_fetch_entity_picture_bytes,
                     base_url,
                     token,
                     entity_id,
                     insecure_ssl=bool(args.ha_insecure_ssl),
+                    conn=ha_conn,
+                    validators=validators,
                 )
-            except Exception as e:
-                print(f"[ha] state fetch failed: {e}")
-                await send_clock(force=False)
-                return
+                if img_bytes is None:
+                    # 304 Not Modified: the artwork is the one last prepared.
+                    if not force and showing_cover:
+                        return True
+                    current_hash = last_cover_hash
+                    image = last_cover_image
+                else:
+                    current_hash = hashlib.blake2b(img_bytes, digest_size=16).digest()
+                    if last_cover_hash == current_hash and last_cover_image is not None:
+                        cover_validators = validators
+                        if not force and showing_cover:
+                            return True
+                        image = last_cover_image
+                    else:
+                        # Decode and resize in a worker so the clock loop keeps ticking meanwhile.
+                        image = await asyncio.to_thread(
+                            prepare_cover_image, img_bytes, canvas, mode, rotate, mirror, invert, cover_resample
+                        )
+                queue_frame(image, force)
+                last_cover_hash = current_hash
+                last_cover_image = image
+                cover_validators = validators
+                last_sent_cover_at = time.monotonic()
+                showing_cover = True
+                last_clock_index = None
+                return True
+
+            async def send_clock(force: bool = False) -> None:
+                nonlocal last_clock_index, showing_cover
+
+                clock_index = get_clock_index(datetime.now(tz))
+                if not force and clock_index == last_clock_index:
+                    return
+
+                image = prepared_clock_frames.get(clock_index)
+                if image is None:
+                    frame = render_minecraft_clock_sprite(sprite_sheet, clock_index)
+                    image = prepare_image_obj(
+                        frame,
+                        canvas,
+                        clock_mode,
+                        rotate,
+                        mirror,
+                        invert,
+                        Image.Resampling.BOX,
+                    )
+                    prepared_clock_frames[clock_index] = image
+                queue_frame(image, force)
+                last_clock_index = clock_index
+                showing_cover = False
 
-            if is_playing_state(state):
+            async def refresh_by_state(
+                force_cover: bool = False, prefetched: Optional[asyncio.Task] = None
+            ) -> None:
                 try:
-                    await send_cover(force=force_cover or not showing_cover)
+                    if prefetched is not None:
+                        state = await prefetched
+                    else:
+                        state = await asyncio.to_thread(
+                            ha_get_state,
+                            base_url,
+                            token,
+                            entity_id,
+                            insecure_ssl=bool(args.ha_insecure_ssl),
+                            conn=ha_conn,
+                        )
                 except Exception as e:
-                    print(f"[ha] cover fetch failed: {e}")
-                    await send_clock(force=not showing_cover)
-            else:
-                await send_clock(force=showing_cover)
-
-        async def clock_loop() -> None:
-            while True:
-                if not showing_cover:
+                    print(f"[ha] state fetch failed: {e}")
                     await send_clock(force=False)
-                await asyncio.sleep(clock_interval)
-
-        clock_task = asyncio.create_task(clock_loop())
-        try:
-            await refresh_by_state(force_cover=True)
-            while True:
-                try:
-                    client = HomeAssistantWS(base_url, token)
-                    async for ev in client.subscribe_state_changed(entity_id=entity_id):
-                        if is_playing_state(ev.new_state):
-                            try:
-                                await send_cover(force=not showing_cover)
-                            except Exception as e:
-                                print(f"[ha] cover update failed: {e}")
-                        else:
-                            await send_clock(force=showing_cover)
-                except asyncio.CancelledError:
-                    raise
-                except Exception as e:
-                    print(f"[ha-ws] error: {e}; reconnecting in {reconnect_delay:.1f}s")
-                    await refresh_by_state(force_cover=False)
-                    await asyncio.sleep(reconnect_delay)
-        finally:
-            clock_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await clock_task
+                    return
+
+                if is_playing_state(state):
+                    try:
+                        await send_cover(force=force_cover or not showing_cover)
+                    except Exception as e:
+                        print(f"[ha] cover fetch failed: {e}")
+                        await send_clock(force=not showing_cover)
+                else:
+                    await send_clock(force=showing_cover)
+
+            async def clock_loop() -> None:
+                while True:
+                    if not showing_cover:
+                        await send_clock(force=False)
+                    # Switching to clock mode is rendered by the WS handler; this loop only needs sprite changes.
+                    await asyncio.sleep(max(clock_interval, seconds_until_next_index(datetime.now(tz)) + 0.05))
+
+            flush_task = asyncio.create_task(flush_loop())
+            clock_task = asyncio.create_task(clock_loop())
+            try:
+                await refresh_by_state(force_cover=True, prefetched=initial_state_task)
+                while True:
+                    try:
+                        client = HomeAssistantWS(base_url, token)
+                        async for ev in client.subscribe_state_changed(entity_id=entity_id):
+                            if is_playing_state(ev.new_state):
+                                picture = entity_picture_of(ev.new_state)
+                                # Position/volume ticks while playing leave the artwork untouched.
+                                if showing_cover and picture is not None and picture == last_entity_picture:
+                                    continue
+                                try:
+                                    if await send_cover(force=not showing_cover):
+                                        last_entity_picture = picture
+                                except Exception as e:
+                                    print(f"[ha] cover update failed: {e}")
+                            else:
+                                await send_clock(force=showing_cover)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        print(f"[ha-ws] error: {e}; reconnecting in {reconnect_delay:.1f}s")
+                        await refresh_by_state(force_cover=False)
+                        await asyncio.sleep(reconnect_delay)
+            finally:
+                clock_task.cancel()
+                flush_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await clock_task
+                with contextlib.suppress(asyncio.CancelledError):
+                    await flush_task
+    finally:
+        # Also reached when the panel connect fails: reap the prefetches and close the socket.
+        sheet_task.cancel()
+        initial_state_task.cancel()
+        await asyncio.gather(sheet_task, initial_state_task, return_exceptions=True)
+        ha_conn.close()
 
 
 def parse_args() -> argparse.Namespace:
@@ -296,6 +401,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--rotate", type=int)
     parser.add_argument("--mirror", action="store_true")
     parser.add_argument("--invert", action="store_true")
+    parser.add_argument(
+        "--quality",
+        choices=tuple(RESAMPLE_BY_QUALITY),
+        default="fast",
+        help="Cover art resampling: fast (bilinear) or high (Lanczos). Default: fast",
+    )
     parser.add_argument(
         "--ble-delay",
         type=float,
@@ -338,7 +449,7 @@ def parse_args() -> argparse.Namespace:
         "--clock-interval",
         type=float,
         default=1.0,
-        help="Seconds between idle clock checks. Default: 1.0",
+        help="Minimum seconds between idle clock checks (the loop otherwise sleeps until the next sprite). Default: 1.0",
     )
     parser.add_argument("--timezone", help="Timezone name (e.g. Europe/Warsaw). Default: device.timezone")
     return parser.parse_args()
@@ -349,6 +460,6 @@ if __name__ == "__main__":
     config = load_config(args.config)
     if args.address:
         config.device = replace(config.device, address=args.address)
-    asyncio.run(run_watch(config, args))
+    run_async(run_watch(config, args))
 
 
@@ -4,45 +4,23 @@ import sys
 import time
 import hashlib
 from dataclasses import replace
-from io import BytesIO
 from pathlib import Path
 
-from PIL import Image
-
 project_root = Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
 from bk_light.config import AppConfig, image_options, load_config
+from bk_light.cover_art import RESAMPLE_BY_QUALITY, prepare_cover_image
+from bk_light.event_loop import run_async
 from bk_light.panel_manager import PanelManager
-from bk_light.home_assistant import HomeAssistantWS, ha_fetch_entity_picture_bytes, normalize_base_url
-
-
-def prepare_image_obj(
-    image: Image.Image,
-    canvas: tuple[int, int],
-    mode: str,
-    rotate: int,
-    mirror: bool,
-    invert: bool,
-) -> Image.Image:
-    # Import inside to avoid adding a hard dependency for users that only want WS detection.
-    from PIL import ImageOps
-
-    image = image.convert("RGB")
-    if rotate:
-        image = image.rotate(rotate % 360, expand=False)
-    if mirror:
-        image = ImageOps.mirror(image)
-    if invert:
-        image = ImageOps.invert(image)
-    if mode == "fit":
-        image = ImageOps.fit(image, canvas, method=Image.Resampling.LANCZOS)
-    elif mode == "cover":
-        image = ImageOps.fit(image, canvas, method=Image.Resampling.BICUBIC)
-    else:
-        image = image.resize(canvas, Image.Resampling.LANCZOS)
-    return image
+from bk_light.home_assistant import (
+    HomeAssistantWS,
+    entity_picture_of,
+    ha_fetch_entity_picture_bytes,
+    normalize_base_url,
+    open_ha_connection,
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -54,6 +32,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--rotate", type=int)
     parser.add_argument("--mirror", action="store_true")
     parser.add_argument("--invert", action="store_true")
+    parser.add_argument(
+        "--quality",
+        choices=tuple(RESAMPLE_BY_QUALITY),
+        default="fast",
+        help="Cover art resampling: fast (bilinear) or high (Lanczos). Default: fast",
+    )
     parser.add_argument(
         "--ble-delay",
         type=float,
@@ -105,6 +89,7 @@ async def run_watch(config: AppConfig, args: argparse.Namespace) -> None:
     overrides = build_override_map(args)
     preset = image_options(config, preset_name, overrides)
     ble_delay = max(0.0, float(args.ble_delay))
+    resample = RESAMPLE_BY_QUALITY[args.quality]
 
     print(f"ble_delay: {ble_delay}")
 
@@ -115,49 +100,72 @@ async def run_watch(config: AppConfig, args: argparse.Namespace) -> None:
     invert = bool(overrides["invert"]) if "invert" in overrides else preset.invert
 
     last_sent_at = 0.0
-    last_hash: str | None = None
-
-    async with PanelManager(config) as manager:
-        canvas = manager.canvas_size
-
-        async def maybe_update() -> None:
-            nonlocal last_sent_at, last_hash
-
-            now = time.monotonic()
-            if min_interval and (now - last_sent_at) < min_interval:
-                return
-
-            img_bytes = await asyncio.to_thread(
-                ha_fetch_entity_picture_bytes,
-                base_url,
-                token,
-                entity_id,
-                insecure_ssl=bool(args.ha_insecure_ssl),
-            )
-            h = hashlib.sha256(img_bytes).hexdigest()
-            if last_hash == h:
-                return
-
-            pil = Image.open(BytesIO(img_bytes))
-            image = prepare_image_obj(pil, canvas, str(mode), rotate, mirror, invert)
-            await manager.send_image(image, delay=ble_delay)
-
-            last_hash = h
-            last_sent_at = time.monotonic()
-
-        # Prime once at startup.
-        await maybe_update()
-
-        while True:
-            try:
-                client = HomeAssistantWS(base_url, token)
-                async for _ev in client.subscribe_state_changed(entity_id=entity_id):
-                    await maybe_update()
-            except asyncio.CancelledError:
-                raise
-            except Exception as e:
-                print(f"[ha-ws] error: {e}; reconnecting in {reconnect_delay:.1f}s")
-                await asyncio.sleep(reconnect_delay)
+    last_hash: bytes | None = None
+    cover_validators: dict[str, str | None] = {}
+    # One keep-alive REST connection for the whole run; cover fetches are sequential.
+    ha_conn = open_ha_connection(base_url, bool(args.ha_insecure_ssl))
+
+    try:
+        async with PanelManager(config) as manager:
+            canvas = manager.canvas_size
+
+            async def maybe_update() -> bool:
+                nonlocal last_sent_at, last_hash, cover_validators
+
+                now = time.monotonic()
+                if min_interval and (now - last_sent_at) < min_interval:
+                    return False
+
+                validators = dict(cover_validators)
+                img_bytes = await asyncio.to_thread(
+                    ha_fetch_entity_picture_bytes,
+                    base_url,
+                    token,
+                    entity_id,
+                    insecure_ssl=bool(args.ha_insecure_ssl),
+                    conn=ha_conn,
+                    validators=validators,
+                )
+                if img_bytes is None:
+                    # 304 Not Modified: the panel already shows this artwork.
+                    return True
+                h = hashlib.blake2b(img_bytes, digest_size=16).digest()
+                if last_hash == h:
+                    cover_validators = validators
+                    return True
+
+                # Decode and resize in a worker so WS frames keep flowing meanwhile.
+                image = await asyncio.to_thread(
+                    prepare_cover_image, img_bytes, canvas, str(mode), rotate, mirror, invert, resample
+                )
+                await manager.send_image(image, delay=ble_delay)
+
+                last_hash = h
+                cover_validators = validators
+                last_sent_at = time.monotonic()
+                return True
+
+            # Prime once at startup.
+            await maybe_update()
+
+            last_entity_picture: str | None = None
+            while True:
+                try:
+                    client = HomeAssistantWS(base_url, token)
+                    async for ev in client.subscribe_state_changed(entity_id=entity_id):
+                        picture = entity_picture_of(ev.new_state)
+                        # Position/volume ticks leave the artwork untouched; skip the fetch entirely.
+                        if picture is not None and picture == last_entity_picture:
+                            continue
+                        if await maybe_update():
+                            last_entity_picture = picture
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    print(f"[ha-ws] error: {e}; reconnecting in {reconnect_delay:.1f}s")
+                    await asyncio.sleep(reconnect_delay)
+    finally:
+        ha_conn.close()
 
 
 if __name__ == "__main__":
@@ -165,6 +173,6 @@ if __name__ == "__main__":
     config = load_config(args.config)
     if args.address:
         config.device = replace(config.device, address=args.address)
-    asyncio.run(run_watch(config, args))
+    run_async(run_watch(config, args))
 
 